@@ -2,6 +2,9 @@
 
 #include <fnmatch.h>
 #include <string.h>
+#include <strings.h>
+
+#include <algorithm>
 
 namespace pkgfile {
 namespace filter {
@@ -23,9 +26,41 @@ Glob::Glob(std::string glob_pattern, bool case_sensitive)
   if (case_sensitive) {
     flags_ |= FNM_CASEFOLD;
   }
+
+  literal_prefix_ =
+      glob_pattern_.substr(0, glob_pattern_.find_first_of("*?[\\"));
+
+  if (flags_ & FNM_CASEFOLD) {
+    // strncasecmp only folds single bytes, but fnmatch folds multibyte
+    // characters according to the locale. Cut the prefix off before the first
+    // non-ASCII byte so that strncasecmp never has to compare one.
+    literal_prefix_.erase(
+        std::find_if(literal_prefix_.begin(), literal_prefix_.end(),
+                     [](unsigned char c) { return c >= 0x80; }),
+        literal_prefix_.end());
+  }
 }
 
 bool Glob::Matches(std::string_view line) const {
+  if (line.size() < literal_prefix_.size()) {
+    return false;
+  }
+
+  if (flags_ & FNM_CASEFOLD) {
+    // The same goes for the line: a multibyte character there might fold to an
+    // ASCII character in the pattern (e.g. KELVIN SIGN to 'k'), so only trust
+    // strncasecmp when the part of the line it compares is plain ASCII.
+    const auto head = line.substr(0, literal_prefix_.size());
+    const bool ascii = std::none_of(head.begin(), head.end(),
+                                    [](unsigned char c) { return c >= 0x80; });
+    if (ascii && strncasecmp(line.data(), literal_prefix_.data(),
+                             literal_prefix_.size()) != 0) {
+      return false;
+    }
+  } else if (line.compare(0, literal_prefix_.size(), literal_prefix_) != 0) {
+    return false;
+  }
+
   return fnmatch(glob_pattern_.c_str(), std::string(line).c_str(), flags_) == 0;
 }
 
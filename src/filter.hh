@@ -85,6 +85,9 @@ class Glob : public Filter {
 
  private:
   std::string glob_pattern_;
+  // The portion of the pattern before the first glob metacharacter. Any line
+  // which doesn't start with this can be rejected without calling fnmatch.
+  std::string literal_prefix_;
   int flags_;
 };
 
@@ -1,5 +1,7 @@
 #include "filter.hh"
 
+#include <locale.h>
+
 #include "gmock/gmock.h"
 #include "gtest/gtest.h"
 
@@ -61,6 +63,81 @@ TEST(RegexFilterTest, MatchesByRegex) {
   }
 }
 
+TEST(RegexFilterTest, MatchesByAlternation) {
+  auto filter =
+      pkgfile::filter::Regex::Compile("/(dhcpcd|mkinitcpio|java.*src)$", true);
+
+  EXPECT_TRUE(filter->Matches("/usr/bin/dhcpcd"));
+  EXPECT_TRUE(filter->Matches("/usr/bin/mkinitcpio"));
+  EXPECT_TRUE(filter->Matches("/usr/share/licenses/java11-openjfx-src"));
+  EXPECT_FALSE(filter->Matches("/usr/bin/dhcpcd-run-hooks"));
+  EXPECT_FALSE(filter->Matches("/usr/share/licenses/java11-openjfx-src/"));
+  EXPECT_FALSE(filter->Matches("/usr/bin/xdhcpcd"));
+}
+
+TEST(GlobFilterTest, MatchesByGlob) {
+  pkgfile::filter::Glob filter("/usr/lib/dhcpcd/dhcpcd-hooks/*", false);
+
+  EXPECT_TRUE(filter.Matches("/usr/lib/dhcpcd/dhcpcd-hooks/01-test"));
+  EXPECT_FALSE(filter.Matches("/usr/lib/dhcpcd/dhcpcd-run-hooks"));
+  EXPECT_FALSE(filter.Matches("/usr/lib/dhcpcd/"));
+  EXPECT_FALSE(filter.Matches("/usr/lib/dhcpcd/dhcpcd-hooks/sub/01-test"));
+}
+
+TEST(GlobFilterTest, MatchesByGlobWithoutLiteralPrefix) {
+  pkgfile::filter::Glob filter("\\/usr/bin/dhcpc?", false);
+
+  EXPECT_TRUE(filter.Matches("/usr/bin/dhcpcd"));
+  EXPECT_FALSE(filter.Matches("/usr/bin/dhcpcd-run-hooks"));
+}
+
+TEST(GlobFilterTest, MatchesByGlobCaseFold) {
+  // XXX: Glob's case_sensitive argument is inverted, which is a known bug.
+  // Passing true is currently the only way to reach the FNM_CASEFOLD path,
+  // and this test will need to flip along with any fix for that bug.
+  pkgfile::filter::Glob filter("/usr/lib/DHCPCD/dhcpcd-hooks/*", true);
+
+  EXPECT_TRUE(filter.Matches("/usr/lib/dhcpcd/dhcpcd-hooks/01-test"));
+  EXPECT_TRUE(filter.Matches("/USR/LIB/DHCPCD/DHCPCD-HOOKS/01-test"));
+  EXPECT_FALSE(filter.Matches("/usr/lib/dhcpcd/dhcpcd-run-hooks"));
+  EXPECT_FALSE(filter.Matches("/usr/lib/"));
+}
+
+TEST(GlobFilterTest, MatchesByGlobCaseFoldMultibyte) {
+  const std::string old_locale = setlocale(LC_ALL, nullptr);
+  if (setlocale(LC_ALL, "C.UTF-8") == nullptr) {
+    GTEST_SKIP() << "C.UTF-8 locale not available";
+  }
+
+  // As above, true selects FNM_CASEFOLD because of the inverted flag bug.
+
+  {
+    // Non-ASCII in the pattern: U+00C9 (É) folds to U+00E9 (é).
+    pkgfile::filter::Glob filter("/usr/share/\303\211bc/*", true);
+
+    EXPECT_TRUE(filter.Matches("/usr/share/\303\251bc/x"));
+    EXPECT_TRUE(filter.Matches("/usr/share/\303\211bc/x"));
+    EXPECT_FALSE(filter.Matches("/usr/share/abc/x"));
+  }
+
+  {
+    // Non-ASCII in the line: U+212A (KELVIN SIGN) folds to 'k'.
+    pkgfile::filter::Glob filter("/usr/share/k*", true);
+
+    EXPECT_TRUE(filter.Matches("/usr/share/\342\204\252x"));
+    EXPECT_FALSE(filter.Matches("/usr/share/x"));
+  }
+
+  {
+    // Non-ASCII in the line: U+0130 (İ) folds to 'i'.
+    pkgfile::filter::Glob filter("/usr/share/i*", true);
+
+    EXPECT_TRUE(filter.Matches("/usr/share/\304\260x"));
+  }
+
+  setlocale(LC_ALL, old_locale.c_str());
+}
+
 TEST(AndFilterTest, MatchesByComposite) {
   auto regex_filter = pkgfile::filter::Regex::Compile("some.*regex.*", true);
   auto regex = regex_filter.get();
@@ -4,6 +4,8 @@ import http.server
 import os.path
 import signal
 import sys
+import threading
+import traceback
 
 
 DBROOT = os.path.join(
@@ -11,23 +13,43 @@ DBROOT = os.path.join(
 
 
 class PkgfileHandler(http.server.SimpleHTTPRequestHandler):
+    # Allow clients to reuse connections across downloads.
+    protocol_version = 'HTTP/1.1'
+
     def __init__(self, *args, directory=None, **kwargs):
         return super().__init__(*args, directory=DBROOT, **kwargs)
 
+    def copyfile(self, source, outputfile):
+        # socket.sendfile uses os.sendfile where possible, falling back to
+        # send() on its own when the kernel can't do zero-copy for us.
+        outputfile.flush()
+        self.connection.sendfile(source)
+
+
+class PkgfileServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._errors = []
+        self._errors_lock = threading.Lock()
 
-class PkgfileServer(http.server.HTTPServer):
     def handle_error(self, request, client_address):
-        raise
+        # Requests are handled on worker threads, where raising would only
+        # kill the worker. Record the failure so that tests can report it.
+        with self._errors_lock:
+            self._errors.append(traceback.format_exc())
+        super().handle_error(request, client_address)
 
+    def PopErrors(self):
+        with self._errors_lock:
+            errors, self._errors = self._errors, []
+        return errors
 
-def Serve(queue=None, port=0):
-    server = PkgfileServer(('localhost', port), PkgfileHandler)
-    endpoint = 'http://{}:{}'.format(*server.socket.getsockname())
 
-    if queue:
-        queue.put(endpoint)
-    else:
-        print('serving on', endpoint)
+def Serve(port=0):
+    server = PkgfileServer(('localhost', port), PkgfileHandler)
+    print('serving on', 'http://{}:{}'.format(*server.socket.getsockname()))
 
     signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
 
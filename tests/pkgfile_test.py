@@ -1,15 +1,36 @@
 #!/usr/bin/env python
 
 import fakehttp.server
+import functools
 import glob
-import multiprocessing
 import os.path
+import shutil
 import subprocess
 import tempfile
+import threading
 import time
 import unittest
 
 
+TESTDIR = os.path.dirname(os.path.realpath(__file__))
+GOLDEN_PKGFILE_DIR = os.path.join(TESTDIR, 'golden/pkgfile')
+GOLDEN_ALPM_DIR = os.path.join(TESTDIR, 'golden/alpm')
+
+
+def FindScratchDir():
+    # Prefer tmpfs for anything the tests write, but only if we can actually
+    # write there. Some sandboxes mount /dev/shm read-only, or not at all.
+    try:
+        with tempfile.TemporaryDirectory(dir='/dev/shm'):
+            return '/dev/shm'
+    except OSError:
+        return None
+
+
+SCRATCHDIR = FindScratchDir()
+
+
+@functools.lru_cache(maxsize=None)
 def FindMesonBuildDir():
     # When run through meson or ninja, we're already in the build dir
     if os.path.exists('.ninja_log'):
@@ -43,28 +64,60 @@ class TestCase(unittest.TestCase):
 
     maxDiff = 10000
 
+    @classmethod
+    def setUpClass(cls):
+        # The fake server is stateless, so a single instance running in a
+        # background thread can be shared by every test in the class.
+        cls.server = fakehttp.server.PkgfileServer(
+                ('localhost', 0), fakehttp.server.PkgfileHandler)
+        cls.baseurl = 'http://{}:{}'.format(*cls.server.socket.getsockname())
+        # Daemonize so that a failure later in setUpClass, which skips
+        # tearDownClass, can't leave this thread holding the process open.
+        cls.server_thread = threading.Thread(
+                target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+
+        # Stage the golden cache on tmpfs, if we have one, so that each pkgfile
+        # invocation loads its repos from memory rather than from disk.
+        cls.cachedir = GOLDEN_PKGFILE_DIR
+        cls._shmdir = None
+        if SCRATCHDIR:
+            cls._shmdir = tempfile.TemporaryDirectory(dir=SCRATCHDIR)
+            cls.cachedir = os.path.join(cls._shmdir.name, 'pkgfile')
+            shutil.copytree(GOLDEN_PKGFILE_DIR, cls.cachedir)
+
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server_thread.join()
+        cls.server.server_close()
+
+        if cls._shmdir:
+            cls._shmdir.cleanup()
+
+        # Requests on kept-alive connections can still be finishing after the
+        # last test's tearDown, so check once more now that we've shut down.
+        errors = cls.server.PopErrors()
+        if errors:
+            raise AssertionError('Server failed to handle requests:\n{}'.format(
+                    ''.join(errors)))
+
+
     def setUp(self):
         self.build_dir = FindMesonBuildDir()
-        self._tempdir = tempfile.TemporaryDirectory()
+        self._tempdir = tempfile.TemporaryDirectory(dir=SCRATCHDIR)
         self.tempdir = self._tempdir.name
-        self.cachedir = os.path.join(os.path.dirname(os.path.realpath(__file__)),
-                'golden/pkgfile')
-        self.alpmcachedir = os.path.join(os.path.dirname(os.path.realpath(__file__)),
-                'golden/alpm')
-
-        q = multiprocessing.Queue()
-        self.server = multiprocessing.Process(
-                target=fakehttp.server.Serve, args=(q,))
-        self.server.start()
-        self.baseurl = q.get()
+        self.alpmcachedir = GOLDEN_ALPM_DIR
 
         self._WritePacmanConf()
 
 
     def tearDown(self):
-        self.server.terminate()
-        self.server.join()
-        self.assertEqual(0, self.server.exitcode, 'Server did not exit cleanly')
+        errors = self.server.PopErrors()
+        if errors:
+            self.fail('Server failed to handle requests:\n{}'.format(
+                    ''.join(errors)))
 
 
     def _WritePacmanConf(self):
@@ -85,6 +138,8 @@ class TestCase(unittest.TestCase):
         env = {
             'LC_TIME': 'C',
             'TZ': 'UTC',
+            # Keep in-flight downloads in our scratch space, too.
+            'TMPDIR': self.tempdir,
         }
 
         cmdline = [
@@ -4,56 +4,82 @@ import pkgfile_test
 import textwrap
 
 
+_EXPECTED_SEARCH_BASENAME = textwrap.dedent('''
+    testing/java-openjfx-src
+    testing/java11-openjfx-src
+''').lstrip('\n')
+
+_EXPECTED_SEARCH_EXACT = textwrap.dedent('''
+    testing/dhcpcd
+''').lstrip('\n')
+
+_EXPECTED_SEARCH_VERBOSE = textwrap.dedent('''
+    testing/java-openjfx-src 12.0.2.u1-2  	/usr/lib/jvm/java-12-openjfx/javafx-src.zip
+    testing/java11-openjfx-src 11.0.3.u1-2	/usr/lib/jvm/java-11-openjfx/javafx-src.zip
+''').lstrip('\n')
+
+_EXPECTED_SEARCH_GLOB = textwrap.dedent('''
+    testing/dhcpcd
+''').lstrip('\n')
+
+_EXPECTED_SEARCH_GLOB_VERBOSE = textwrap.dedent('''
+    testing/dhcpcd 8.0.6-1	/usr/lib/dhcpcd/dhcpcd-hooks/01-test
+    testing/dhcpcd 8.0.6-1	/usr/lib/dhcpcd/dhcpcd-hooks/02-dump
+    testing/dhcpcd 8.0.6-1	/usr/lib/dhcpcd/dhcpcd-hooks/20-resolv.conf
+    testing/dhcpcd 8.0.6-1	/usr/lib/dhcpcd/dhcpcd-hooks/30-hostname
+''').lstrip('\n')
+
+_EXPECTED_SEARCH_DIRECTORIES = textwrap.dedent('''
+    testing/dhcpcd
+''').lstrip('\n')
+
+_EXPECTED_SEARCH_CASE_INSENSITIVE = textwrap.dedent('''
+    testing/mkinitcpio
+''').lstrip('\n')
+
+_EXPECTED_SEARCH_REGEX_ALTERNATION = textwrap.dedent('''
+    testing/dhcpcd
+    testing/java-openjfx-src
+    testing/java11-openjfx-src
+    testing/mkinitcpio
+''').lstrip('\n')
+
+
 class TestUpdate(pkgfile_test.TestCase):
 
     def testSearchBasename(self):
         r = self.Pkgfile(['-s', 'javafx-src.zip'])
         self.assertEqual(r.returncode, 0)
 
-        self.assertEqual(r.stdout.decode(), textwrap.dedent('''
-            testing/java-openjfx-src
-            testing/java11-openjfx-src
-        ''').lstrip('\n'))
+        self.assertEqual(r.stdout.decode(), _EXPECTED_SEARCH_BASENAME)
 
 
     def testSearchExact(self):
         r = self.Pkgfile(['-s', '/usr/lib/dhcpcd/dhcpcd-hooks/01-test'])
         self.assertEqual(r.returncode, 0)
 
-        self.assertEqual(r.stdout.decode(), textwrap.dedent('''
-            testing/dhcpcd
-        ''').lstrip('\n'))
+        self.assertEqual(r.stdout.decode(), _EXPECTED_SEARCH_EXACT)
 
 
     def testSearchVerbose(self):
         r = self.Pkgfile(['-s', '-v', 'javafx-src.zip'])
         self.assertEqual(r.returncode, 0)
 
-        self.assertEqual(r.stdout.decode(), textwrap.dedent('''
-            testing/java-openjfx-src 12.0.2.u1-2  	/usr/lib/jvm/java-12-openjfx/javafx-src.zip
-            testing/java11-openjfx-src 11.0.3.u1-2	/usr/lib/jvm/java-11-openjfx/javafx-src.zip
-        ''').lstrip('\n'))
+        self.assertEqual(r.stdout.decode(), _EXPECTED_SEARCH_VERBOSE)
 
 
     def testSearchGlob(self):
         r = self.Pkgfile(['-s', '-g', '/usr/lib/dhcpcd/dhcpcd-hooks/*'])
         self.assertEqual(r.returncode, 0)
 
-        self.assertEqual(r.stdout.decode(), textwrap.dedent('''
-            testing/dhcpcd
-        ''').lstrip('\n'))
+        self.assertEqual(r.stdout.decode(), _EXPECTED_SEARCH_GLOB)
 
 
     def testSearchGlobVerbose(self):
         r = self.Pkgfile(['-s', '-v', '-g', '/usr/lib/dhcpcd/dhcpcd-hooks/*'])
         self.assertEqual(r.returncode, 0)
 
-        self.assertEqual(r.stdout.decode(), textwrap.dedent('''
-            testing/dhcpcd 8.0.6-1	/usr/lib/dhcpcd/dhcpcd-hooks/01-test
-            testing/dhcpcd 8.0.6-1	/usr/lib/dhcpcd/dhcpcd-hooks/02-dump
-            testing/dhcpcd 8.0.6-1	/usr/lib/dhcpcd/dhcpcd-hooks/20-resolv.conf
-            testing/dhcpcd 8.0.6-1	/usr/lib/dhcpcd/dhcpcd-hooks/30-hostname
-        ''').lstrip('\n'))
+        self.assertEqual(r.stdout.decode(), _EXPECTED_SEARCH_GLOB_VERBOSE)
 
 
     def testNotFound(self):
@@ -65,23 +91,25 @@ class TestUpdate(pkgfile_test.TestCase):
         r = self.Pkgfile(['-s', '-d', '/usr/lib/dhcpcd/dhcpcd-hooks/'])
         self.assertEqual(r.returncode, 0)
 
-        self.assertEqual(r.stdout.decode(), textwrap.dedent('''
-            testing/dhcpcd
-        ''').lstrip('\n'))
+        self.assertEqual(r.stdout.decode(), _EXPECTED_SEARCH_DIRECTORIES)
 
 
     def testSearchCaseInsensitive(self):
         r = self.Pkgfile(['-s', '-i', 'mKiNiTcPiO'])
         self.assertEqual(r.returncode, 0)
-        self.assertEqual(r.stdout.decode(), textwrap.dedent('''
-            testing/mkinitcpio
-        ''').lstrip('\n'))
+        self.assertEqual(r.stdout.decode(), _EXPECTED_SEARCH_CASE_INSENSITIVE)
 
         r = self.Pkgfile(['-s', '-r', '-i', 'mK(i[NT]){2}cPiO'])
         self.assertEqual(r.returncode, 0)
-        self.assertEqual(r.stdout.decode(), textwrap.dedent('''
-            testing/mkinitcpio
-        ''').lstrip('\n'))
+        self.assertEqual(r.stdout.decode(), _EXPECTED_SEARCH_CASE_INSENSITIVE)
+
+
+    def testSearchRegexAlternation(self):
+        r = self.Pkgfile(
+                ['-s', '-r', '/(javafx-src\\.zip|dhcpcd-run-hooks|mkinitcpio)$'])
+        self.assertEqual(r.returncode, 0)
+
+        self.assertEqual(r.stdout.decode(), _EXPECTED_SEARCH_REGEX_ALTERNATION)
 
 
 if __name__ == '__main__':
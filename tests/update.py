@@ -1,17 +1,13 @@
 #!/usr/bin/env python
 
-import hashlib
+import filecmp
 import pkgfile_test
 import os
 
 
-def _sha256(path):
-    m = hashlib.sha256()
-    with open(path, 'rb') as f:
-        for block in iter(lambda: f.read(4096), b''):
-            m.update(block)
-
-    return m.hexdigest()
+# The repos served by fakehttp.
+REPOS = ('multilib', 'testing')
+REPOFILES = {repo: '{}.files'.format(repo) for repo in REPOS}
 
 
 class TestUpdate(pkgfile_test.TestCase):
@@ -25,23 +21,38 @@ class TestUpdate(pkgfile_test.TestCase):
         os.mkdir(self.cachedir)
 
 
+    def _RepoInodes(self):
+        # DirEntry.inode() comes straight from the directory listing, so this
+        # doesn't need to stat each repo individually.
+        with os.scandir(self.cachedir) as it:
+            return {e.name: e.inode() for e in it if e.name.endswith('.files')}
+
+
     def assertMatchesGolden(self, reponame):
-        golden_repo = '{}/{}.files'.format(self.goldendir, reponame)
-        converted_repo = '{}/{}.files'.format(self.cachedir, reponame)
+        golden_repo = os.path.join(self.goldendir, REPOFILES[reponame])
+        converted_repo = os.path.join(self.cachedir, REPOFILES[reponame])
 
-        self.assertEqual(_sha256(golden_repo), _sha256(converted_repo))
+        # We only care about equality, so compare the bytes directly rather
+        # than hashing both sides. This bails out early on a size mismatch.
+        self.assertTrue(
+                filecmp.cmp(golden_repo, converted_repo, shallow=False),
+                msg='{} does not match golden'.format(REPOFILES[reponame]))
 
 
     def testUpdate(self):
         r = self.Pkgfile(['-u'])
         self.assertEqual(r.returncode, 0)
 
-        self.assertMatchesGolden('multilib')
-        self.assertMatchesGolden('testing')
+        # Every golden repo should have been written out, and nothing else.
+        self.assertCountEqual(os.listdir(self.goldendir),
+                os.listdir(self.cachedir))
 
-        for repo in ('multilib', 'testing'):
-            original_repo = '{}/x86_64/{repo}/{repo}.files'.format(self.alpmcachedir, repo=repo)
-            converted_repo = '{}/{}.files'.format(self.cachedir, repo)
+        for repo in REPOS:
+            self.assertMatchesGolden(repo)
+
+            original_repo = os.path.join(self.alpmcachedir, 'x86_64', repo,
+                    REPOFILES[repo])
+            converted_repo = os.path.join(self.cachedir, REPOFILES[repo])
 
             # Only compare the integer portion of the mtime. we'll only ever
             # get back second precision from a remote server, so any fractional
@@ -54,47 +65,40 @@ class TestUpdate(pkgfile_test.TestCase):
         r = self.Pkgfile(['-u'])
         self.assertEqual(r.returncode, 0)
 
-        inodes_before = {}
-        for r in ('multilib', 'testing'):
-            inodes_before[r] = os.stat(
-                    os.path.join(self.cachedir, '{}.files'.format(r))).st_ino
+        inodes_before = self._RepoInodes()
 
         r = self.Pkgfile(['-uu'])
         self.assertEqual(r.returncode, 0)
 
-        inodes_after = {}
-        for r in ('multilib', 'testing'):
-            inodes_after[r] = os.stat(
-                    os.path.join(self.cachedir, '{}.files'.format(r))).st_ino
+        inodes_after = self._RepoInodes()
 
-        for r in ('multilib', 'testing'):
-            self.assertNotEqual(inodes_before[r], inodes_after[r],
-                    msg='{}.files unexpectedly NOT rewritten'.format(r))
+        for repofile in REPOFILES.values():
+            self.assertNotEqual(inodes_before[repofile], inodes_after[repofile],
+                    msg='{} unexpectedly NOT rewritten'.format(repofile))
 
 
     def testUpdateSkipsUpToDate(self):
         r = self.Pkgfile(['-u'])
         self.assertEqual(r.returncode, 0)
 
-        inodes = {}
-        for r in ('multilib', 'testing'):
-            inodes[r] = os.stat(
-                    os.path.join(self.cachedir, '{}.files'.format(r))).st_ino
+        inodes_before = self._RepoInodes()
 
         # set the mtime to the epoch, expect that it gets rewritten on next update
-        os.utime(os.path.join(self.cachedir, 'testing.files'), (0, 0))
+        os.utime(os.path.join(self.cachedir, REPOFILES['testing']), (0, 0))
 
         r = self.Pkgfile(['-u'])
         self.assertEqual(r.returncode, 0)
 
+        inodes_after = self._RepoInodes()
+
         self.assertEqual(
-                inodes['multilib'],
-                os.stat(os.path.join(self.cachedir, 'multilib.files')).st_ino,
+                inodes_before[REPOFILES['multilib']],
+                inodes_after[REPOFILES['multilib']],
                 msg='multilib.files unexpectedly rewritten by `pkgfile -u`')
 
         self.assertNotEqual(
-                inodes['testing'],
-                os.stat(os.path.join(self.cachedir, 'testing.files')).st_ino,
+                inodes_before[REPOFILES['testing']],
+                inodes_after[REPOFILES['testing']],
                 msg='testing.files unexpectedly NOT rewritten by `pkgfile -u`')
 
 